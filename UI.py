@@ -3,7 +3,7 @@ import string
 import random
 import secrets
 from typing import Tuple
-from logic import get_matrix_type, get_determinant, letter_to_number, dict_inverse, generate_key, is_int_pair
+from logic import get_matrix_type, get_determinant, letter_to_number, dict_inverse, generate_key, is_int_pair, ALPHABET
 import sys
 import argparse
 from email_utils import send_email
@@ -115,9 +115,9 @@ def prompt_for_plaintext(matrix_type: int) -> str:
     """
     Prompt the user for plaintext and validate it.
     Args:
-        matrix_type: 2 or 3 (for padding).
+        matrix_type: 2 or 3 (for the padding warning).
     Returns:
-        Validated and padded plaintext string.
+        Validated plaintext string; padding is applied by BlockGroups.from_text.
     """
     plaintext = (
         input("Enter plaintext: ")
@@ -126,14 +126,14 @@ def prompt_for_plaintext(matrix_type: int) -> str:
         .lower()
         .translate(str.maketrans("", "", string.punctuation))
     )
+    if any(letter not in ALPHABET for letter in plaintext):
+        print("Warning: Non-letter characters will be removed from plaintext.")
+        plaintext = "".join(letter for letter in plaintext if letter in ALPHABET)
     if not plaintext:
         print("Plaintext cannot be empty.")
         sys.exit()
-    if not plaintext.isalpha():
-        print("Warning: Non-letter characters will be removed from plaintext.")
     if len(plaintext) % matrix_type != 0:
         print(f"Plaintext length not a multiple of {matrix_type}, padding with 'z'.")
-        plaintext += "z" * (matrix_type - len(plaintext) % matrix_type)
     return plaintext
 
 
@@ -150,11 +150,12 @@ def prompt_for_ciphertext() -> str:
         .lower()
         .translate(str.maketrans("", "", string.punctuation))
     )
+    if any(letter not in ALPHABET for letter in ciphertext):
+        print("Warning: Non-letter characters will be removed from ciphertext.")
+        ciphertext = "".join(letter for letter in ciphertext if letter in ALPHABET)
     if not ciphertext:
         print("Ciphertext cannot be empty.")
         sys.exit()
-    if not ciphertext.isalpha():
-        print("Warning: Non-letter characters will be removed from ciphertext.")
     return ciphertext
 
 
@@ -3,9 +3,27 @@ import numpy as np
 import random
 import sys
 import json
+from typing import Optional
 from key import load_keys, generate_key_pair
 from UI import prompt_for_key, prompt_for_plaintext, prompt_for_ciphertext, print_result, parse_args, is_int_pair
-from logic import get_matrix_type, get_determinant, letter_to_number, dict_inverse, generate_key, encode, decode
+from logic import get_matrix_type, get_determinant, letter_to_number, dict_inverse, generate_key, encode, decode, BlockGroups
+
+
+def build_groups(text: str, matrix_type: int, pad_letter: Optional[str] = "z") -> BlockGroups:
+    """
+    Split text into blocks, exiting with a message if it is not valid cipher input.
+    Args:
+        text: Letters to split into blocks.
+        matrix_type: 2 or 3.
+        pad_letter: Letter used to pad plaintext, or None for ciphertext.
+    Returns:
+        BlockGroups for encode/decode.
+    """
+    try:
+        return BlockGroups.from_text(text, matrix_type, pad_letter)
+    except ValueError as e:
+        print(e)
+        sys.exit(1)
 
 
 def main() -> None:
@@ -98,21 +116,11 @@ def main() -> None:
             sys.exit(1)
         text = args.text.replace(" ", "").lower()
         if mode == "encode":
-            if len(text) % matrix_type != 0:
-                text += "z" * (matrix_type - len(text) % matrix_type)
-            message_matrix = [letter_to_number(letter) for letter in text]
-            groups = [
-                message_matrix[i : i + matrix_type]
-                for i in range(0, len(message_matrix), matrix_type)
-            ]
+            groups = build_groups(text, matrix_type)
             result = encode(matrix_key, groups)
             print_result(result, "encode", key_return)
         else:
-            ciphertext_matrix = [letter_to_number(letter) for letter in text]
-            groups_cipher = [
-                ciphertext_matrix[i : i + matrix_type]
-                for i in range(0, len(ciphertext_matrix), matrix_type)
-            ]
+            groups_cipher = build_groups(text, matrix_type, pad_letter=None)
             result = decode(det, groups_cipher, matrix_key)
             print_result(result, "decode", key_return)
         return
@@ -122,21 +130,13 @@ def main() -> None:
     key_return, matrix_key, matrix_type, det = prompt_for_key(p, private_key, n, d)
     if choice in ("encode", "e"):
         plaintext = prompt_for_plaintext(matrix_type)
-        message_matrix = [letter_to_number(letter) for letter in plaintext]
-        groups = [
-            message_matrix[i : i + matrix_type]
-            for i in range(0, len(message_matrix), matrix_type)
-        ]
+        groups = build_groups(plaintext, matrix_type)
         print("Encoding...")
         result = encode(matrix_key, groups)
         print_result(result, "encode", key_return)
     elif choice in ("decode", "d"):
         ciphertext = prompt_for_ciphertext()
-        ciphertext_matrix = [letter_to_number(letter) for letter in ciphertext]
-        groups_cipher = [
-            ciphertext_matrix[i : i + matrix_type]
-            for i in range(0, len(ciphertext_matrix), matrix_type)
-        ]
+        groups_cipher = build_groups(ciphertext, matrix_type, pad_letter=None)
         print("Decoding...")
         result = decode(det, groups_cipher, matrix_key)
         print_result(result, "decode", key_return)
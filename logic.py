@@ -2,9 +2,8 @@ import nltk
 from nltk.corpus import words
 import numpy as np
 import sys
-from typing import List
+from typing import Iterator, List, Optional, Union
 from sympy import Matrix
-from typing import List
 import random
 
 dict_inverse = {
@@ -22,6 +21,111 @@ dict_inverse = {
     25: 25,
 }
 
+ALPHABET = "abcdefghijklmnopqrstuvwxyz"
+
+# Number of blocks multiplied at once; bounds the int64 scratch space used by
+# encode/decode so it stays small next to the uint8 block buffer.
+CHUNK_BLOCKS = 1 << 20
+
+
+class BlockGroups:
+    """
+    Message blocks stored in one contiguous uint8 buffer.
+    Attributes:
+        blocks: (N, k) view of the letter indices into alphabet, one row per block,
+            or None once encode/decode has consumed the buffer.
+        pad_length: Number of padding letters appended to the plaintext to fill
+            the last block, so they can be stripped after decoding (0 for ciphertext).
+        alphabet: Alphabet the indices refer to; its length is the cipher modulus.
+    """
+
+    __slots__ = ("blocks", "pad_length", "alphabet")
+
+    def __init__(self, blocks: np.ndarray, pad_length: int = 0, alphabet: str = ALPHABET) -> None:
+        _check_alphabet(alphabet)
+        self.blocks = blocks
+        self.pad_length = pad_length
+        self.alphabet = alphabet
+
+    @classmethod
+    def from_text(
+        cls, text: str, block_size: int, pad_letter: Optional[str] = "z", alphabet: str = ALPHABET
+    ) -> "BlockGroups":
+        """
+        Build blocks from text, padding the last block with pad_letter.
+        Args:
+            text: Letters of alphabet to split into blocks.
+            block_size: 2 or 3 (the matrix type).
+            pad_letter: Letter of alphabet used to fill the last block, or None
+                to reject text whose length is not a multiple of block_size (ciphertext).
+            alphabet: Alphabet the text is written in.
+        Returns:
+            BlockGroups holding the text as indices into alphabet.
+        Raises:
+            ValueError: If the text has letters outside alphabet or cannot be padded.
+        """
+        _check_alphabet(alphabet)
+        if block_size < 1:
+            raise ValueError("Block size must be at least 1.")
+        if pad_letter is not None and (len(pad_letter) != 1 or pad_letter not in alphabet):
+            raise ValueError(f"Pad letter must be a single letter of '{alphabet}'.")
+        pad_length = -len(text) % block_size
+        if pad_length and pad_letter is None:
+            raise ValueError(f"Text length must be a multiple of {block_size}.")
+        try:
+            buffer = bytearray(text, "ascii")
+        except UnicodeEncodeError:
+            raise ValueError(f"Text must only contain the letters '{alphabet}'.") from None
+        if pad_length:
+            buffer.extend(pad_letter.encode("ascii") * pad_length)
+        numbers = np.frombuffer(buffer, dtype=np.uint8)
+        _translate(numbers, _index_table(alphabet))
+        if numbers.max(initial=0) >= len(alphabet):
+            raise ValueError(f"Text must only contain the letters '{alphabet}'.")
+        return cls(numbers.reshape(-1, block_size), pad_length, alphabet)
+
+    def take_blocks(self) -> np.ndarray:
+        """
+        Hand the block buffer over to the caller, marking these groups as consumed.
+        Returns:
+            The (N, k) block buffer.
+        Raises:
+            ValueError: If the buffer was already taken.
+        """
+        blocks = self._live_blocks()
+        self.blocks = None
+        return blocks
+
+    def _live_blocks(self) -> np.ndarray:
+        if self.blocks is None:
+            raise ValueError("BlockGroups was already consumed by encode/decode.")
+        return self.blocks
+
+    def __len__(self) -> int:
+        return len(self._live_blocks())
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        return iter(self._live_blocks())
+
+
+def _check_alphabet(alphabet: str) -> None:
+    """Raise ValueError unless alphabet is at least two distinct ASCII letters."""
+    if len(alphabet) < 2 or not alphabet.isascii() or len(set(alphabet)) != len(alphabet):
+        raise ValueError("Alphabet must be at least 2 distinct ASCII characters.")
+
+
+def _index_table(alphabet: str) -> np.ndarray:
+    """Return a byte -> index table for alphabet; bytes outside it map to 255."""
+    table = np.full(256, 255, dtype=np.uint8)
+    table[np.frombuffer(alphabet.encode("ascii"), dtype=np.uint8)] = np.arange(len(alphabet))
+    return table
+
+
+def _translate(buffer: np.ndarray, table: np.ndarray) -> None:
+    """Map every byte of a flat uint8 buffer through table in place, a chunk at a time."""
+    for start in range(0, len(buffer), CHUNK_BLOCKS):
+        buffer[start : start + CHUNK_BLOCKS] = table[buffer[start : start + CHUNK_BLOCKS]]
+
 
 def get_matrix_type(key: str) -> int:
     """Return the matrix type (2 for 2x2, 3 for 3x3) based on key length."""
@@ -38,15 +142,42 @@ def number_to_letter(number: int) -> str:
     return chr(number + ord("a"))
 
 
-def encode(matrix_key: np.ndarray, groups: List[List[int]]) -> str:
+def apply_key(matrix_key: np.ndarray, groups: BlockGroups) -> str:
+    """
+    Multiply every block by the key matrix modulo len(alphabet), a chunk of blocks at a time.
+    The result is written back into the block buffer, so groups is consumed.
+    Args:
+        matrix_key: The key matrix.
+        groups: Blocks to transform.
+    Returns:
+        Resulting string.
+    Raises:
+        ValueError: If groups was already consumed.
+    """
+    modulus = len(groups.alphabet)
+    key_t = np.asarray(matrix_key, dtype=np.int64).T
+    blocks = groups.take_blocks()
+    for start in range(0, len(blocks), CHUNK_BLOCKS):
+        chunk = blocks[start : start + CHUNK_BLOCKS].astype(np.int64)
+        blocks[start : start + CHUNK_BLOCKS] = (chunk @ key_t) % modulus
+    letters = np.frombuffer(groups.alphabet.encode("ascii"), dtype=np.uint8)
+    flat = blocks.reshape(-1)
+    _translate(flat, letters)
+    return str(flat.data, "ascii")
+
+
+def encode(matrix_key: np.ndarray, groups: Union[BlockGroups, List[List[int]]]) -> str:
     """
     Encode the plaintext using the Hill cipher matrix key.
     Args:
         matrix_key: The key matrix for encoding.
-        groups: List of plaintext number groups to encode.
+        groups: BlockGroups or list of plaintext number groups to encode.
+            A BlockGroups is consumed and cannot be passed to encode/decode again.
     Returns:
         Encoded string.
     """
+    if isinstance(groups, BlockGroups):
+        return apply_key(matrix_key, groups)
     encoded = ""
     for group in groups:
         group_matrix = np.array(group)
@@ -56,16 +187,26 @@ def encode(matrix_key: np.ndarray, groups: List[List[int]]) -> str:
     return encoded
 
 
-def decode(det: int, groups: List[List[int]], matrix_key: np.ndarray) -> str:
+def decode(det: int, groups: Union[BlockGroups, List[List[int]]], matrix_key: np.ndarray) -> str:
     """
     Decode the ciphertext using the Hill cipher matrix key.
     Args:
         det: Determinant of the key matrix.
-        groups: List of ciphertext number groups to decode.
+        groups: BlockGroups or list of ciphertext number groups to decode.
+            A BlockGroups is consumed and cannot be passed to encode/decode again.
         matrix_key: The key matrix for decoding.
     Returns:
         Decoded string.
+    Raises:
+        ValueError: If the key is not invertible modulo the BlockGroups alphabet length.
     """
+    if isinstance(groups, BlockGroups):
+        modulus = len(groups.alphabet)
+        try:
+            matrix_key1 = Matrix(matrix_key).inv_mod(modulus)
+        except ValueError:
+            raise ValueError(f"Key is not invertible modulo {modulus}.") from None
+        return apply_key(np.array(matrix_key1.tolist(), dtype=np.int64), groups)
     mult_inverse = dict_inverse[det]
     matrix_key1 = (Matrix(matrix_key).adjugate() * mult_inverse) % 26
     decoded = ""
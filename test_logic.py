@@ -0,0 +1,97 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("nltk")
+
+from logic import BlockGroups, decode, encode, get_determinant, letter_to_number
+
+KEY_2 = np.array([[7, 8], [11, 11]])
+KEY_3 = np.array([[6, 24, 1], [13, 16, 10], [20, 17, 15]])
+
+
+def list_groups(text, matrix_type):
+    numbers = [letter_to_number(letter) for letter in text]
+    return [numbers[i : i + matrix_type] for i in range(0, len(numbers), matrix_type)]
+
+
+@pytest.mark.parametrize("matrix_key", [KEY_2, KEY_3])
+def test_encode_matches_list_path(matrix_key):
+    matrix_type = len(matrix_key)
+    text = "thequickbrownfoxjumpsoverthelazydog"
+    padded = text + "z" * (-len(text) % matrix_type)
+    expected = encode(matrix_key, list_groups(padded, matrix_type))
+    assert encode(matrix_key, BlockGroups.from_text(text, matrix_type)) == expected
+
+
+@pytest.mark.parametrize("matrix_key", [KEY_2, KEY_3])
+def test_decode_matches_list_path(matrix_key):
+    matrix_type = len(matrix_key)
+    det = get_determinant(matrix_key, matrix_type)
+    ciphertext = encode(matrix_key, BlockGroups.from_text("attackatdawnxyz", matrix_type))
+    expected = decode(det, list_groups(ciphertext, matrix_type), matrix_key)
+    groups = BlockGroups.from_text(ciphertext, matrix_type, pad_letter=None)
+    assert decode(det, groups, matrix_key) == expected
+
+
+@pytest.mark.parametrize("matrix_key", [KEY_2, KEY_3])
+def test_round_trip(matrix_key):
+    matrix_type = len(matrix_key)
+    det = get_determinant(matrix_key, matrix_type)
+    groups = BlockGroups.from_text("hello", matrix_type)
+    ciphertext = encode(matrix_key, groups)
+    decoded = decode(det, BlockGroups.from_text(ciphertext, matrix_type, pad_letter=None), matrix_key)
+    assert decoded == "hello" + "z" * groups.pad_length
+
+
+def test_from_text_pads_last_block():
+    groups = BlockGroups.from_text("abcde", 3)
+    assert groups.pad_length == 1
+    assert groups.blocks.dtype == np.uint8
+    assert groups.blocks.tolist() == [[0, 1, 2], [3, 4, 25]]
+
+
+def test_from_text_rejects_unpadded_ciphertext():
+    with pytest.raises(ValueError):
+        BlockGroups.from_text("abc", 2, pad_letter=None)
+
+
+@pytest.mark.parametrize("text", ["café", "abc1", "ABCD"])
+def test_from_text_rejects_letters_outside_alphabet(text):
+    with pytest.raises(ValueError):
+        BlockGroups.from_text(text, 2)
+
+
+def test_custom_alphabet_sets_modulus():
+    alphabet = "abcde"
+    groups = BlockGroups.from_text("edcb", 2, pad_letter="e", alphabet=alphabet)
+    assert encode(np.array([[1, 1], [0, 1]]), groups) == "cddb"
+
+
+def test_groups_are_consumed_by_encode():
+    groups = BlockGroups.from_text("hello", 2)
+    encode(KEY_2, groups)
+    with pytest.raises(ValueError):
+        encode(KEY_2, groups)
+
+
+@pytest.mark.parametrize("pad_letter", ["zz", "", "1"])
+def test_from_text_rejects_bad_pad_letter(pad_letter):
+    with pytest.raises(ValueError):
+        BlockGroups.from_text("abc", 2, pad_letter=pad_letter)
+
+
+def test_from_text_rejects_bad_block_size():
+    with pytest.raises(ValueError):
+        BlockGroups.from_text("abc", 0)
+
+
+@pytest.mark.parametrize("alphabet", ["a", "abca", "abcé"])
+def test_from_text_rejects_bad_alphabet(alphabet):
+    with pytest.raises(ValueError):
+        BlockGroups.from_text("abc", 2, alphabet=alphabet)
+
+
+def test_decode_rejects_key_not_invertible_for_alphabet():
+    groups = BlockGroups.from_text("abcd", 2, pad_letter=None, alphabet="abcd")
+    with pytest.raises(ValueError):
+        decode(1, groups, np.array([[1, 1], [1, 3]]))